@@ -3,85 +3,134 @@ NextPy - The Python Web Framdwork
 File-based routing, SSR, SSG, and more with FastAPI + PSX (True JSX)
 """
 
-__version__ = "4.0.0"
-
-from nextpy.core.router import Router, Route, DynamicRoute
-from nextpy.core.renderer import Renderer
-from nextpy.core.data_fetching import (
-    get_server_side_props,
-    get_static_props,
-    get_static_paths,
-)
-from nextpy.components.head import Head
-from nextpy.components.link import Link
-from nextpy.server.app import create_app
-
-# Import all PSX features for easy access
-from nextpy.psx import (
-    # Core PSX
-    PSXElement, PSXParser, psx, render_psx, fragment, key,
-    process_python_logic, runtime, SafeExpressionEngine,
-    
-    # VDOM
-    VNode, create_element, render, update, get_vdom_metrics,
-    
-    # Renderer
-    PSXRenderer, renderer, render_psx_component,
-    
-    # Components
-    PSXComponent, component, class_component, ChildrenComponent,
-    register_component, clsx,
-    
-    # React Hooks
-    useState, useEffect, useContext, useReducer, useRef,
-    useMemo, useCallback, useImperativeHandle, useLayoutEffect,
-    useDebugValue, useTransition, useDeferredValue, useId,
-    
-    # Custom Hooks
-    useCounter, useToggle, useLocalStorage, useFetch, useDebounce,
-    useInterval, usePrevious, useAsync, useMediaQuery, useGeolocation, usePerformance,
-    
-    # Event Handlers
-    create_onclick, create_ondblclick, create_onmousedown, create_onmouseup,
-    create_onmouseover, create_onmouseout, create_onmouseenter, create_onmouseleave, create_onmousemove,
-    create_onchange, create_onsubmit, create_onreset, create_onfocus, create_onblur,
-    create_oninput, create_oninvalid, create_onselect,
-    create_onkeydown, create_onkeyup, create_onkeypress,
-    create_ontouchstart, create_ontouchend, create_ontouchmove, create_ontouchcancel,
-    create_onload, create_onunload, create_onresize, create_onscroll,
-    create_ondrag, create_ondragstart, create_ondragend, create_ondragenter,
-    create_ondragleave, create_ondragover, create_ondrop,
-    create_onplay, create_onpause, create_onended, create_onvolumechange,
-    create_ontimeupdate, create_onseeking, create_onseeked,
-    create_onloadstart, create_onprogress, create_onerror, create_onabort,
-    create_onanimationstart, create_onanimationend, create_onanimationiteration,
-    create_ontransitionend, create_ontransitionrun, create_ontransitionstart,
-    create_onwheel, create_oncopy, create_oncut, create_onpaste,
-    create_onbeforeprint, create_onafterprint, create_onstorage,
-    create_onopen, create_onmessage, create_onclose, create_oninstall, create_onactivate,
-    
-    # Utils
-    compile_psx, compile_psx_file, is_psx_file, PSXCompiler,
-)
+import functools
+import importlib
+
+# Public names are resolved on first access (PEP 562) so that ``import nextpy``
+# does not drag in FastAPI, Jinja2 and the PSX runtime up front.
+_LAZY: dict[str, tuple[str, str]] = {
+    # Core NextPy
+    'Router': ('nextpy.core.router', 'Router'),
+    'Route': ('nextpy.core.router', 'Route'),
+    'DynamicRoute': ('nextpy.core.router', 'DynamicRoute'),
+    'Renderer': ('nextpy.core.renderer', 'Renderer'),
+    'create_app': ('nextpy.server.app', 'create_app'),
+    'get_server_side_props': ('nextpy.core.data_fetching.ssr', 'get_server_side_props'),
+    'get_static_props': ('nextpy.core.data_fetching.ssg_props', 'get_static_props'),
+    'get_static_paths': ('nextpy.core.data_fetching.ssg_paths', 'get_static_paths'),
+    'Head': ('nextpy.components.head', 'Head'),
+    'Link': ('nextpy.components.link', 'Link'),
+
+    # All PSX features for easy access
+    **{name: ('nextpy.psx', name) for name in (
+        # Core PSX
+        'PSXElement', 'PSXParser', 'psx', 'render_psx', 'fragment', 'key',
+        'process_python_logic', 'runtime', 'SafeExpressionEngine',
+
+        # VDOM
+        'VNode', 'create_element', 'render', 'update', 'get_vdom_metrics',
+
+        # Renderer
+        'PSXRenderer', 'renderer', 'render_psx_component',
+
+        # Components
+        'PSXComponent', 'component', 'class_component', 'ChildrenComponent',
+        'register_component', 'clsx',
+
+        # React Hooks
+        'useState', 'useEffect', 'useContext', 'useReducer', 'useRef',
+        'useMemo', 'useCallback', 'useImperativeHandle', 'useLayoutEffect',
+        'useDebugValue', 'useTransition', 'useDeferredValue', 'useId',
+
+        # Custom Hooks
+        'useCounter', 'useToggle', 'useLocalStorage', 'useFetch', 'useDebounce',
+        'useInterval', 'usePrevious', 'useAsync', 'useMediaQuery', 'useGeolocation', 'usePerformance',
+
+        # Event Handlers
+        'create_onclick', 'create_ondblclick', 'create_onmousedown', 'create_onmouseup',
+        'create_onmouseover', 'create_onmouseout', 'create_onmouseenter', 'create_onmouseleave', 'create_onmousemove',
+        'create_onchange', 'create_onsubmit', 'create_onreset', 'create_onfocus', 'create_onblur',
+        'create_oninput', 'create_oninvalid', 'create_onselect',
+        'create_onkeydown', 'create_onkeyup', 'create_onkeypress',
+        'create_ontouchstart', 'create_ontouchend', 'create_ontouchmove', 'create_ontouchcancel',
+        'create_onload', 'create_onunload', 'create_onresize', 'create_onscroll',
+        'create_ondrag', 'create_ondragstart', 'create_ondragend', 'create_ondragenter',
+        'create_ondragleave', 'create_ondragover', 'create_ondrop',
+        'create_onplay', 'create_onpause', 'create_onended', 'create_onvolumechange',
+        'create_ontimeupdate', 'create_onseeking', 'create_onseeked',
+        'create_onloadstart', 'create_onprogress', 'create_onerror', 'create_onabort',
+        'create_onanimationstart', 'create_onanimationend', 'create_onanimationiteration',
+        'create_ontransitionend', 'create_ontransitionrun', 'create_ontransitionstart',
+        'create_onwheel', 'create_oncopy', 'create_oncut', 'create_onpaste',
+        'create_onbeforeprint', 'create_onafterprint', 'create_onstorage',
+        'create_onopen', 'create_onmessage', 'create_onclose', 'create_oninstall', 'create_onactivate',
+
+        # Utils
+        'compile_psx', 'compile_psx_file', 'is_psx_file', 'PSXCompiler',
+    )},
+
+    # Legacy hooks for backward compatibility
+    **{f'legacy_{name}': ('nextpy.hooks', name) for name in (
+        'useState', 'useEffect', 'useContext', 'useReducer', 'useCallback',
+        'useMemo', 'useRef', 'useCounter', 'useToggle', 'useLocalStorage',
+        'useFetch', 'useDebounce',
+    )},
+}
+
+
+# Names grouped by source module, so the first access to e.g. a legacy hook
+# binds every name from ``nextpy.hooks`` in one pass.
+_BY_MODULE = {}
+for _name, (_module_name, _attr) in _LAZY.items():
+    _BY_MODULE.setdefault(_module_name, []).append((_name, _attr))
+del _name, _module_name, _attr
+
+# Misses (hasattr probes, IPython completion) are rejected with one hash lookup
+_LAZY_NAMES = frozenset(_LAZY)
+
+
+# Matches ``version`` in pyproject.toml; used by checkouts that were never installed
+_SOURCE_VERSION = "4.0.0"
+
+
+def _read_version():
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        value = version("nextpy-framework")
+    except PackageNotFoundError:
+        value = _SOURCE_VERSION
+    globals()["__version__"] = value
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve(module_name):
+    """Import a source module once and return its (lazy name, value) pairs"""
+    # import_module waits on the import lock while another thread is still
+    # initializing the module, so no caller sees it half-loaded
+    module = importlib.import_module(module_name)
+    return tuple((lazy_name, getattr(module, attr)) for lazy_name, attr in _BY_MODULE[module_name])
+
+
+def __getattr__(name):
+    """Resolve a public name on first access and cache it in the module"""
+    if name not in _LAZY_NAMES:
+        if name == "__version__":
+            return _read_version()
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, _ = _LAZY[name]
+    namespace = globals()
+    namespace.update(_resolve(module_name))
+    return namespace[name]
+
+
+def __dir__():
+    return _DIR
 
-# Legacy hooks for backward compatibility
-from nextpy.hooks import (
-    useState as legacy_useState,
-    useEffect as legacy_useEffect,
-    useContext as legacy_useContext,
-    useReducer as legacy_useReducer,
-    useCallback as legacy_useCallback,
-    useMemo as legacy_useMemo,
-    useRef as legacy_useRef,
-    useCounter as legacy_useCounter,
-    useToggle as legacy_useToggle,
-    useLocalStorage as legacy_useLocalStorage,
-    useFetch as legacy_useFetch,
-    useDebounce as legacy_useDebounce,
-)
 
 # Export everything for easy access
-__all__ = [
+__all__ = (
     # Core NextPy
     'Router', 'Route', 'DynamicRoute', 'Renderer', 'create_app',
     'get_server_side_props', 'get_static_props', 'get_static_paths',
@@ -136,11 +185,15 @@ __all__ = [
     'legacy_useState', 'legacy_useEffect', 'legacy_useContext', 'legacy_useReducer',
     'legacy_useCallback', 'legacy_useMemo', 'legacy_useRef', 'legacy_useCounter',
     'legacy_useToggle', 'legacy_useLocalStorage', 'legacy_useFetch', 'legacy_useDebounce',
-]
+)
 
 
 maintainers = [
     {"name": "NextPy Team", "email": "team@nextpy.dev"}
 ]
 
-main = "nextpy.server.app:create_app"
\ No newline at end of file
+main = "nextpy.server.app:create_app"
+
+
+# Computed once; the lazy names never change after import
+_DIR = tuple(sorted(set(__all__) | _LAZY_NAMES | {"__version__"}))
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 import hashlib
 import json
+import shutil
 from datetime import datetime
 
 
@@ -20,10 +21,11 @@ class BuildCache:
         self.cache: Dict[str, str] = self._load_cache()
     
     def _load_cache(self) -> Dict[str, str]:
-        if self.cache_file.exists():
+        try:
             with open(self.cache_file) as f:
                 return json.load(f)
-        return {}
+        except FileNotFoundError:
+            return {}
     
     def _save_cache(self) -> None:
         with open(self.cache_file, "w") as f:
@@ -32,7 +34,7 @@ class BuildCache:
     def get_hash(self, file_path: str) -> str:
         """Get SHA256 hash of file"""
         with open(file_path, "rb") as f:
-            return hashlib.sha256(f.read()).hexdigest()
+            return hashlib.file_digest(f, "sha256").hexdigest()
     
     def is_changed(self, file_path: str) -> bool:
         """Check if file has changed since last build"""
@@ -114,10 +116,9 @@ class BuildOptimizer:
         
         for file in list(output_dir.rglob("*.js")) + list(output_dir.rglob("*.css")):
             if file.is_file():
-                with open(file, "rb") as f_in:
-                    content = f_in.read()
-                with gzip.open(f"{file}.gz", "wb") as f_out:
-                    f_out.write(content)
+                # Stream in 128 KiB chunks instead of holding the whole bundle
+                with open(file, "rb") as f_in, gzip.open(f"{file}.gz", "wb") as f_out:
+                    shutil.copyfileobj(f_in, f_out, 128 * 1024)
                 compressed_count += 1
         
         return compressed_count
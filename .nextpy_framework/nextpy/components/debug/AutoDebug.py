@@ -1024,8 +1024,7 @@ def inject_debug_icon(html_content: str, page_props: Dict[str, Any] = None) -> s
     # Insert debug icon before closing body tag
     if "</body>" in html_content:
         # Insert before </body>
-        parts = html_content.split("</body>")
-        html_content = parts[0] + debug_icon_html + debug_scripts + debug_css + "</body>" + parts[1] if len(parts) > 1 else parts[0] + debug_icon_html + debug_scripts + debug_css + "</body>"
+        html_content = html_content.replace("</body>", debug_icon_html + debug_scripts + debug_css + "</body>", 1)
     else:
         # Append at the end
         html_content += debug_icon_html + debug_scripts + debug_css
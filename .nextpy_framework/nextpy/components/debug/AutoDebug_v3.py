@@ -457,8 +457,7 @@ def inject_runtime_integration(html_content: str) -> str:
     
     # Insert before closing body tag
     if "</body>" in html_content:
-        parts = html_content.split("</body>")
-        html_content = parts[0] + integration_script + "</body>" + parts[1] if len(parts) > 1 else parts[0] + integration_script + "</body>"
+        html_content = html_content.replace("</body>", integration_script + "</body>", 1)
     else:
         html_content += integration_script
     
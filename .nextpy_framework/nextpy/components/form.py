@@ -4,7 +4,13 @@ Input, TextArea, Select, Checkbox, Radio, Form, etc.
 """
 
 from typing import Optional, List, Dict, Any, Union
-from ..jsx import jsx, input, textarea, select, option, button, label, div, form as form_tag
+# label is imported as label_tag: Checkbox, Radio and FormGroup take a `label` argument
+from ..jsx import jsx, input, textarea, select, option, button, div, form as form_tag
+from ..jsx import label as label_tag
+
+# Shared by the text-like inputs (Input, TextArea, Select, Number/Date/Time/Password)
+_FIELD_CLASS = "w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
+_CHOICE_LABEL_CLASS = "ml-2 block text-sm text-gray-900"
 
 
 def Input(
@@ -18,13 +24,12 @@ def Input(
     **kwargs
 ):
     """Input component - returns JSX element"""
-    default_class = "w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
     props = {
         'type': type,
         'name': name,
         'placeholder': placeholder,
         'value': value,
-        'className': class_name or default_class
+        'className': class_name or _FIELD_CLASS
     }
     
     if required:
@@ -46,12 +51,11 @@ def TextArea(
     **kwargs
 ):
     """TextArea component - returns JSX element"""
-    default_class = "w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
     props = {
         'name': name,
         'placeholder': placeholder,
         'rows': rows,
-        'className': class_name or default_class
+        'className': class_name or _FIELD_CLASS
     }
     
     if required:
@@ -76,10 +80,9 @@ def Select(
     if options is None:
         options = []
     
-    default_class = "w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
     props = {
         'name': name,
-        'className': class_name or default_class
+        'className': class_name or _FIELD_CLASS
     }
     
     if required:
@@ -111,7 +114,6 @@ def Checkbox(
 ):
     """Checkbox component - returns JSX element"""
     input_class = "h-4 w-4 text-blue-600 focus:ring-blue-500 border-gray-300 rounded"
-    label_class = "ml-2 block text-sm text-gray-900"
     
     input_props = {
         'type': 'checkbox',
@@ -128,7 +130,7 @@ def Checkbox(
     
     return div({'className': 'flex items-center'},
         input(input_props),
-        label({'className': label_class}, label)
+        label_tag({'className': _CHOICE_LABEL_CLASS}, label)
     )
 
 
@@ -144,7 +146,6 @@ def Radio(
 ):
     """Radio component - returns JSX element"""
     input_class = "h-4 w-4 text-blue-600 focus:ring-blue-500 border-gray-300"
-    label_class = "ml-2 block text-sm text-gray-900"
     
     input_props = {
         'type': 'radio',
@@ -162,7 +163,7 @@ def Radio(
     
     return div({'className': 'flex items-center'},
         input(input_props),
-        label({'className': label_class}, label)
+        label_tag({'className': _CHOICE_LABEL_CLASS}, label)
     )
 
 
@@ -236,7 +237,7 @@ def FormGroup(
     content = []
     if label:
         label_text = label + (" *" if required else "")
-        content.append(label({'className': label_class}, label_text))
+        content.append(label_tag({'className': label_class}, label_text))
     
     content.extend(children)
     
@@ -289,13 +290,12 @@ def NumberInput(
     **kwargs
 ):
     """NumberInput component - returns JSX element"""
-    default_class = "w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
     props = {
         'type': 'number',
         'name': name,
         'placeholder': placeholder,
         'value': str(value),
-        'className': class_name or default_class
+        'className': class_name or _FIELD_CLASS
     }
     
     if min is not None:
@@ -321,12 +321,11 @@ def DateInput(
     **kwargs
 ):
     """DateInput component - returns JSX element"""
-    default_class = "w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
     props = {
         'type': 'date',
         'name': name,
         'value': value,
-        'className': class_name or default_class
+        'className': class_name or _FIELD_CLASS
     }
     
     if required:
@@ -346,12 +345,11 @@ def TimeInput(
     **kwargs
 ):
     """TimeInput component - returns JSX element"""
-    default_class = "w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
     props = {
         'type': 'time',
         'name': name,
         'value': value,
-        'className': class_name or default_class
+        'className': class_name or _FIELD_CLASS
     }
     
     if required:
@@ -372,13 +370,12 @@ def PasswordInput(
     **kwargs
 ):
     """PasswordInput component - returns JSX element"""
-    default_class = "w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
     props = {
         'type': 'password',
         'name': name,
         'placeholder': placeholder,
         'value': value,
-        'className': class_name or default_class
+        'className': class_name or _FIELD_CLASS
     }
     
     if required:
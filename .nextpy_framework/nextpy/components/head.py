@@ -3,10 +3,32 @@ NextPy Head Component - SEO and meta tag management
 Similar to Next.js's next/head
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional
 from markupsafe import Markup
 
 
+# Attributes that identify a tag for de-duplication, checked in order
+_META_KEYS = ("name", "property", "http-equiv", "charset", "itemprop")
+_LINK_KEYS = ("rel", "href")
+
+
+def _dedupe_key(tag: str, attrs: Dict[str, str]) -> Hashable:
+    """Key under which a later tag replaces an earlier one"""
+    if "key" in attrs:
+        return (tag, "key", attrs.pop("key"))
+    if tag == "meta":
+        for name in _META_KEYS:
+            if name in attrs:
+                return (tag, name, attrs[name])
+    elif tag == "link":
+        if "rel" in attrs and "href" in attrs:
+            return (tag, attrs["rel"], attrs["href"])
+    elif "src" in attrs:
+        return (tag, attrs["src"])
+    # Nothing to identify it by (e.g. inline scripts): always kept
+    return object()
+
+
 class Head:
     """
     Head component for managing document head elements
@@ -44,26 +66,39 @@ class Head:
         self.og_type = og_type
         self.twitter_card = twitter_card
         self.favicon = favicon
-        self.extra_meta: List[Dict[str, str]] = []
-        self.extra_links: List[Dict[str, str]] = []
-        self.extra_scripts: List[Dict[str, str]] = []
+        # Keyed by _dedupe_key; a repeated tag replaces the earlier one in place
+        self._meta: Dict[Hashable, Dict[str, str]] = {}
+        self._links: Dict[Hashable, Dict[str, str]] = {}
+        self._scripts: Dict[Hashable, Dict[str, str]] = {}
         self.extra_kwargs = kwargs
         
+    @property
+    def extra_meta(self) -> List[Dict[str, str]]:
+        return list(self._meta.values())
+        
+    @property
+    def extra_links(self) -> List[Dict[str, str]]:
+        return list(self._links.values())
+        
+    @property
+    def extra_scripts(self) -> List[Dict[str, str]]:
+        return list(self._scripts.values())
+        
     def add_meta(self, **attrs: str) -> "Head":
-        """Add a custom meta tag"""
-        self.extra_meta.append(attrs)
+        """Add a custom meta tag (replaces one with the same name/property)"""
+        self._meta[_dedupe_key("meta", attrs)] = attrs
         return self
         
     def add_link(self, **attrs: str) -> "Head":
-        """Add a custom link tag"""
-        self.extra_links.append(attrs)
+        """Add a custom link tag (replaces one with the same rel and href)"""
+        self._links[_dedupe_key("link", attrs)] = attrs
         return self
         
     def add_script(self, src: Optional[str] = None, **attrs: str) -> "Head":
-        """Add a script tag"""
+        """Add a script tag (replaces one with the same src)"""
         if src:
             attrs["src"] = src
-        self.extra_scripts.append(attrs)
+        self._scripts[_dedupe_key("script", attrs)] = attrs
         return self
         
     def render(self) -> str:
@@ -117,15 +152,15 @@ class Head:
         if self.favicon:
             elements.append(f'<link rel="icon" href="{self._escape(self.favicon)}">')
             
-        for meta in self.extra_meta:
+        for meta in self._meta.values():
             attrs_str = " ".join(f'{k}="{self._escape(v)}"' for k, v in meta.items())
             elements.append(f"<meta {attrs_str}>")
             
-        for link in self.extra_links:
+        for link in self._links.values():
             attrs_str = " ".join(f'{k}="{self._escape(v)}"' for k, v in link.items())
             elements.append(f"<link {attrs_str}>")
             
-        for script in self.extra_scripts:
+        for script in self._scripts.values():
             attrs_str = " ".join(f'{k}="{self._escape(v)}"' for k, v in script.items())
             if "src" in script:
                 elements.append(f"<script {attrs_str}></script>")
@@ -3,146 +3,160 @@ Visual Components for NextPy
 Tabs, Accordion, Dropdown, Modal, Card variations
 """
 
+import functools
 
-def Tabs(tabs: list, active_index: int = 0) -> str:
-    """
-    Tabs component
-    tabs: [{"label": "Tab 1", "content": "<p>Content 1</p>"}, ...]
-    """
-    tab_buttons_list = []
-    for i, tab in enumerate(tabs):
-        active_class = "border-blue-600 text-blue-600 font-bold" if i == active_index else "border-gray-300 text-gray-600"
-        tab_buttons_list.append(f'<button class="px-4 py-2 border-b-2 {active_class}" onclick="switchTab({i})">\n            {tab["label"]}\n        </button>')
-    tab_buttons = "\n".join(tab_buttons_list)
-    
-    tab_contents_list = []
-    for i, tab in enumerate(tabs):
-        display_class = "block" if i == active_index else "hidden"
-        tab_contents_list.append(f'<div id="tab-content-{i}" class="{display_class} py-4">\n            {tab["content"]}\n        </div>')
-    tab_contents = "\n".join(tab_contents_list)
-    
-    return f'''
+
+# Page shells with their static <script> blocks, built once at import and
+# filled with %-formatting (the JS braces need no escaping this way)
+_TABS_TEMPLATE = '''
     <div class="space-y-4">
         <div class="flex border-b border-gray-200">
-            {tab_buttons}
+            %s
         </div>
         <div>
-            {tab_contents}
+            %s
         </div>
     </div>
     <script>
-        function switchTab(index) {{
+        function switchTab(index) {
             document.querySelectorAll('[id^="tab-content-"]').forEach(el => el.classList.add('hidden'));
             document.getElementById('tab-content-' + index).classList.remove('hidden');
-            document.querySelectorAll('button').forEach((btn, i) => {{
+            document.querySelectorAll('button').forEach((btn, i) => {
                 btn.classList.toggle('border-blue-600', i === index);
                 btn.classList.toggle('text-blue-600', i === index);
                 btn.classList.toggle('font-bold', i === index);
                 btn.classList.toggle('border-gray-300', i !== index);
                 btn.classList.toggle('text-gray-600', i !== index);
-            }});
-        }}
+            });
+        }
     </script>
     '''
 
-
-def Accordion(items: list) -> str:
-    """
-    Accordion component
-    items: [{"title": "Section 1", "content": "<p>Content 1</p>"}, ...]
-    """
-    accordion_items = []
-    for i, item in enumerate(items):
-        accordion_items.append(f'''
-        <div class="border border-gray-300 mb-2 rounded-lg overflow-hidden">
-            <button onclick="toggleAccordion({i})" class="w-full text-left px-4 py-3 bg-gray-100 hover:bg-gray-200 font-semibold flex justify-between items-center">
-                {item["title"]}
-                <span id="accordion-icon-{i}">▼</span>
-            </button>
-            <div id="accordion-content-{i}" class="hidden px-4 py-3 bg-white text-gray-700">
-                {item["content"]}
-            </div>
-        </div>
-        ''')
-    accordion_html = "\n".join(accordion_items)
-    
-    return f'''
+_ACCORDION_TEMPLATE = '''
     <div class="space-y-2">
-        {accordion_html}
+        %s
     </div>
     <script>
-        function toggleAccordion(index) {{
+        function toggleAccordion(index) {
             const content = document.getElementById('accordion-content-' + index);
             const icon = document.getElementById('accordion-icon-' + index);
             content.classList.toggle('hidden');
             icon.textContent = content.classList.contains('hidden') ? '▼' : '▲';
-        }}
+        }
     </script>
     '''
 
-
-def Dropdown(label: str, items: list, position: str = "left") -> str:
-    """
-    Dropdown component
-    items: [{"label": "Option 1", "href": "/path"}, ...]
-    """
-    position_class = "right-0" if position == "right" else "left-0"
-    items_html = "\n".join([
-        f'<a href="{item.get("href", "#")}" class="block px-4 py-2 text-gray-700 hover:bg-gray-100">{item["label"]}</a>'
-        for item in items
-    ])
-    
-    return f'''
+_DROPDOWN_TEMPLATE = '''
     <div class="relative inline-block">
         <button onclick="toggleDropdown()" class="px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700">
-            {label}
+            %s
         </button>
-        <div id="dropdown-menu" class="hidden absolute {position_class} mt-2 bg-white border border-gray-300 rounded-lg shadow-lg z-10">
-            {items_html}
+        <div id="dropdown-menu" class="hidden absolute %s mt-2 bg-white border border-gray-300 rounded-lg shadow-lg z-10">
+            %s
         </div>
     </div>
     <script>
-        function toggleDropdown() {{
+        function toggleDropdown() {
             const menu = document.getElementById('dropdown-menu');
             menu.classList.toggle('hidden');
-        }}
-        document.addEventListener('click', function(event) {{
+        }
+        document.addEventListener('click', function(event) {
             const menu = document.getElementById('dropdown-menu');
             if (!menu.parentElement.contains(event.target)) menu.classList.add('hidden');
-        }});
+        });
     </script>
     '''
 
-
-def Modal(title: str, content: str, footer: str = "", show: bool = False) -> str:
-    """Modal component"""
-    display = "flex" if show else "hidden"
-    footer_html = f'<div class="px-6 py-4 border-t border-gray-200 flex justify-end gap-2">{footer}</div>' if footer else ''
-    return f'''
-    <div id="modal-overlay" class="{display} fixed inset-0 bg-black bg-opacity-50 justify-center items-center z-50">
+_MODAL_TEMPLATE = '''
+    <div id="modal-overlay" class="%s fixed inset-0 bg-black bg-opacity-50 justify-center items-center z-50">
         <div class="bg-white rounded-lg shadow-xl max-w-md w-full mx-4">
             <div class="px-6 py-4 border-b border-gray-200 flex justify-between items-center">
-                <h2 class="text-xl font-bold">{title}</h2>
+                <h2 class="text-xl font-bold">%s</h2>
                 <button onclick="closeModal()" class="text-gray-500 hover:text-gray-700 text-2xl">&times;</button>
             </div>
             <div class="px-6 py-4">
-                {content}
+                %s
             </div>
-            {footer_html}
+            %s
         </div>
     </div>
     <script>
-        function openModal() {{
+        function openModal() {
             document.getElementById('modal-overlay').classList.remove('hidden');
             document.getElementById('modal-overlay').classList.add('flex');
-        }}
-        function closeModal() {{
+        }
+        function closeModal() {
             document.getElementById('modal-overlay').classList.add('hidden');
             document.getElementById('modal-overlay').classList.remove('flex');
-        }}
+        }
     </script>
     '''
 
+_TAB_ACTIVE_CLASS = "border-blue-600 text-blue-600 font-bold"
+_TAB_INACTIVE_CLASS = "border-gray-300 text-gray-600"
+
+
+def Tabs(tabs: list, active_index: int = 0) -> str:
+    """
+    Tabs component
+    tabs: [{"label": "Tab 1", "content": "<p>Content 1</p>"}, ...]
+    """
+    # One pass fills both the button row and the panels
+    tab_buttons_list = []
+    tab_contents_list = []
+    for i, tab in enumerate(tabs):
+        if i == active_index:
+            active_class, display_class = _TAB_ACTIVE_CLASS, "block"
+        else:
+            active_class, display_class = _TAB_INACTIVE_CLASS, "hidden"
+        tab_buttons_list.append(f'<button class="px-4 py-2 border-b-2 {active_class}" onclick="switchTab({i})">\n            {tab["label"]}\n        </button>')
+        tab_contents_list.append(f'<div id="tab-content-{i}" class="{display_class} py-4">\n            {tab["content"]}\n        </div>')
+
+    return _TABS_TEMPLATE % ("\n".join(tab_buttons_list), "\n".join(tab_contents_list))
+
+
+def Accordion(items: list) -> str:
+    """
+    Accordion component
+    items: [{"title": "Section 1", "content": "<p>Content 1</p>"}, ...]
+    """
+    accordion_items = []
+    for i, item in enumerate(items):
+        accordion_items.append(f'''
+        <div class="border border-gray-300 mb-2 rounded-lg overflow-hidden">
+            <button onclick="toggleAccordion({i})" class="w-full text-left px-4 py-3 bg-gray-100 hover:bg-gray-200 font-semibold flex justify-between items-center">
+                {item["title"]}
+                <span id="accordion-icon-{i}">▼</span>
+            </button>
+            <div id="accordion-content-{i}" class="hidden px-4 py-3 bg-white text-gray-700">
+                {item["content"]}
+            </div>
+        </div>
+        ''')
+
+    return _ACCORDION_TEMPLATE % "\n".join(accordion_items)
+
+
+def Dropdown(label: str, items: list, position: str = "left") -> str:
+    """
+    Dropdown component
+    items: [{"label": "Option 1", "href": "/path"}, ...]
+    """
+    position_class = "right-0" if position == "right" else "left-0"
+    items_html = "\n".join(
+        f'<a href="{item.get("href", "#")}" class="block px-4 py-2 text-gray-700 hover:bg-gray-100">{item["label"]}</a>'
+        for item in items
+    )
+
+    return _DROPDOWN_TEMPLATE % (label, position_class, items_html)
+
+
+def Modal(title: str, content: str, footer: str = "", show: bool = False) -> str:
+    """Modal component"""
+    display = "flex" if show else "hidden"
+    footer_html = f'<div class="px-6 py-4 border-t border-gray-200 flex justify-end gap-2">{footer}</div>' if footer else ''
+    return _MODAL_TEMPLATE % (display, title, content, footer_html)
+
 
 def Card(title: str, content: str, image: str = "", footer: str = "") -> str:
     """Enhanced Card component"""
@@ -173,13 +187,21 @@ def Breadcrumb(items: list) -> str:
     return f'<nav class="text-sm text-gray-600 mb-4">{breadcrumb_html}</nav>'
 
 
+_PAGE_ACTIVE_TEMPLATE = '<span class="px-3 py-1 bg-blue-600 text-white rounded">%d</span>'
+_PAGE_LINK_TEMPLATE = '<a href="%s?page=%d" class="px-3 py-1 border border-gray-300 rounded hover:bg-gray-100">%d</a>'
+
+
 def Pagination(current: int = 1, total: int = 10, base_url: str = "") -> str:
     """Pagination component"""
-    pages = []
-    for i in range(1, total + 1):
-        if i == current:
-            pages.append(f'<span class="px-3 py-1 bg-blue-600 text-white rounded">{i}</span>')
-        else:
-            pages.append(f'<a href="{base_url}?page={i}" class="px-3 py-1 border border-gray-300 rounded hover:bg-gray-100">{i}</a>')
-    
-    return f'<div class="flex gap-2">{" ".join(pages)}</div>'
+    return _pagination(current, total, base_url)
+
+
+@functools.lru_cache(maxsize=1024)
+def _pagination(current: int, total: int, base_url: str) -> str:
+    # List pages render the same few (current, total, base_url) triples over
+    # and over, and the result is an immutable string, so it is cached
+    pages = " ".join(
+        _PAGE_ACTIVE_TEMPLATE % i if i == current else _PAGE_LINK_TEMPLATE % (base_url, i, i)
+        for i in range(1, total + 1)
+    )
+    return f'<div class="flex gap-2">{pages}</div>'
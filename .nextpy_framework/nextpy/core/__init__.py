@@ -1,13 +1,36 @@
 """NextPy Core Module - Routing, Rendering, and Data Fetching"""
 
-from nextpy.core.router import Router, Route, DynamicRoute
-from nextpy.core.renderer import Renderer
-from nextpy.core.data_fetching import (
-    get_server_side_props,
-    get_static_props,
-    get_static_paths,
-)
-from nextpy.core.builder import Builder
+import importlib
+
+# Resolved on first access so importing one submodule (e.g. the SSG data
+# fetching helpers) does not load the renderer and builder as well.
+_LAZY = {
+    "Router": ("nextpy.core.router", "Router"),
+    "Route": ("nextpy.core.router", "Route"),
+    "DynamicRoute": ("nextpy.core.router", "DynamicRoute"),
+    "Renderer": ("nextpy.core.renderer", "Renderer"),
+    "get_server_side_props": ("nextpy.core.data_fetching.ssr", "get_server_side_props"),
+    "get_static_props": ("nextpy.core.data_fetching.ssg_props", "get_static_props"),
+    "get_static_paths": ("nextpy.core.data_fetching.ssg_paths", "get_static_paths"),
+    "Builder": ("nextpy.core.builder", "Builder"),
+}
+
+
+def __getattr__(name):
+    """Resolve a public name on first access and cache it in the module"""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "Router",
@@ -32,11 +32,18 @@ class Builder:
         templates_dir: str = "templates",
         public_dir: str = "public",
         out_dir: str = "out",
+        concurrency: Optional[int] = None,
     ):
         self.pages_dir = Path(pages_dir)
         self.templates_dir = Path(templates_dir)
         self.public_dir = Path(public_dir)
         self.out_dir = Path(out_dir)
+        # Pages rendered at once; data fetching usually waits on I/O
+        if concurrency is None:
+            concurrency = os.cpu_count() or 4
+        elif concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        self.concurrency = concurrency
         
         self.router = Router(pages_dir, templates_dir)
         self.renderer = Renderer(templates_dir, pages_dir, public_dir)
@@ -102,15 +109,14 @@ class Builder:
         """Build all static (non-dynamic) routes"""
         static_routes = self.router.get_static_routes()
         
-        for route in static_routes:
-            if route.is_api:
-                continue
-                
-            await self._build_page(route)
+        await self._build_pages(
+            [(route, None) for route in static_routes if not route.is_api]
+        )
             
     async def _build_dynamic_routes(self) -> None:
         """Build dynamic routes using getStaticPaths"""
         dynamic_routes = [r for r in self.router.routes if r.is_dynamic]
+        jobs = []
         
         for route in dynamic_routes:
             if route.is_api:
@@ -123,7 +129,28 @@ class Builder:
                     
                     for path_config in paths_result.paths:
                         params = path_config.get("params", path_config)
-                        await self._build_page(route, params)
+                        jobs.append((route, params))
+
+        await self._build_pages(jobs)
+
+    async def _build_pages(self, jobs: List[tuple]) -> None:
+        """Build (route, params) pairs, at most self.concurrency at a time"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(route: Route, params: Optional[Dict[str, str]]) -> None:
+            async with semaphore:
+                await self._build_page(route, params)
+
+        for page in asyncio.as_completed([bounded(r, p) for r, p in jobs]):
+            await page
+
+        # Pages finish in any order; keep the manifest (and so the sitemap)
+        # in route order
+        pages = self.build_manifest["pages"]
+        for route, params in jobs:
+            path = self._resolve_path(route.path, params or {})
+            if path in pages:
+                pages[path] = pages.pop(path)
                         
     async def _build_page(
         self, 
@@ -27,6 +27,19 @@ except ImportError:
     should_show_debug = None
 
 
+def _file_stat(file_path: Path) -> Optional[os.stat_result]:
+    """One stat() call instead of exists() followed by stat(); None if missing"""
+    try:
+        return os.stat(file_path)
+    except OSError:
+        return None
+
+
+def _file_mtime(file_path: Path) -> float:
+    stat = _file_stat(file_path)
+    return stat.st_mtime if stat is not None else 0
+
+
 class ComponentRenderer:
     """Renders Next.js-style Python components to HTML"""
     
@@ -53,10 +66,10 @@ class ComponentRenderer:
             return False
             
         # In debug mode, check file modification time
-        if self.debug and file_path.exists():
-            file_mtime = file_path.stat().st_mtime
+        if self.debug:
+            stat = _file_stat(file_path)
             cache_mtime = cache_entry.get('file_mtime', 0)
-            if file_mtime > cache_mtime:
+            if stat is not None and stat.st_mtime > cache_mtime:
                 return False
                 
         return True
@@ -118,12 +131,12 @@ class ComponentRenderer:
                     raise ImportError(f"Could not load module from {file_path}")
             
             # Cache the module with metadata
-            file_mtime = file_path.stat().st_mtime if file_path.exists() else 0
+            stat = _file_stat(file_path)
             cache_entry = {
                 'module': module,
                 'timestamp': time.time(),
-                'file_mtime': file_mtime,
-                'file_size': file_path.stat().st_size if file_path.exists() else 0
+                'file_mtime': stat.st_mtime if stat is not None else 0,
+                'file_size': stat.st_size if stat is not None else 0
             }
             
             self.cache[str(file_path)] = cache_entry
@@ -180,7 +193,7 @@ class ComponentRenderer:
                             self.cache[static_props_key] = {
                                 'props': result['props'],
                                 'timestamp': time.time(),
-                                'file_mtime': file_path.stat().st_mtime if file_path.exists() else 0
+                                'file_mtime': _file_mtime(file_path)
                             }
             
             # Get the main component
@@ -263,7 +276,7 @@ class ComponentRenderer:
                             self.cache[static_props_key] = {
                                 'props': result['props'],
                                 'timestamp': time.time(),
-                                'file_mtime': file_path.stat().st_mtime if file_path.exists() else 0
+                                'file_mtime': _file_mtime(file_path)
                             }
             
             # Get the main component
@@ -374,7 +387,7 @@ class ComponentRenderer:
             self.render_cache[render_cache_key] = {
                 'html': html,
                 'timestamp': time.time(),
-                'file_mtime': file_path.stat().st_mtime if file_path.exists() else 0
+                'file_mtime': _file_mtime(file_path)
             }
             
             return html
@@ -11,7 +11,8 @@ from typing import Dict, List, Optional, Callable, Any, Tuple
 from dataclasses import dataclass, field
 from pydantic import BaseModel
 
-from .router import Route, DynamicRoute, RouteParams
+from .router import Route, DynamicRoute, RouteParams, RouteTrie
+from .router import CATCH_ALL_SEGMENT, DYNAMIC_SEGMENT
 from .component_renderer import ComponentRenderer
 
 
@@ -42,6 +43,8 @@ class ComponentRouter:
         self.routes: List[Route] = []
         self.api_routes: List[Route] = []
         self._route_cache: Dict[str, Route] = {}
+        self._page_trie = RouteTrie()
+        self._api_trie = RouteTrie()
         self.renderer = ComponentRenderer()
         
     def scan_pages(self) -> None:
@@ -93,8 +96,10 @@ class ComponentRouter:
             if part == "index":
                 continue
                 
-            catch_all_match = re.match(r"\[\.\.\.(\w+)\]", part)
-            dynamic_match = re.match(r"\[(\w+)\]", part)
+            catch_all_match = dynamic_match = None
+            if part.startswith("["):
+                catch_all_match = CATCH_ALL_SEGMENT.match(part)
+                dynamic_match = DYNAMIC_SEGMENT.match(part)
             
             if catch_all_match:
                 param_name = catch_all_match.group(1)
@@ -121,7 +126,7 @@ class ComponentRouter:
         pattern = None
         if is_dynamic:
             pattern_str = "^" + path.replace("/", r"\/") + "$"
-            pattern_str = re.sub(r"\\\(\?P", "(?P", pattern_str)
+            pattern_str = pattern_str.replace(r"\(?P", "(?P")
             pattern_str = pattern_str.replace(r"\[", "[").replace(r"\]", "]")
             pattern_str = pattern_str.replace(r"\+", "+")
             try:
@@ -523,6 +528,8 @@ class ComponentRouter:
                 
         self.routes.sort(key=route_priority)
         self.api_routes.sort(key=route_priority)
+        self._page_trie = RouteTrie(self.routes)
+        self._api_trie = RouteTrie(self.api_routes)
         
     def match(self, url_path: str) -> Optional[Tuple[Route, Dict[str, str]]]:
         """Find a route that matches the given URL path"""
@@ -533,16 +540,11 @@ class ComponentRouter:
             params = route.matches(url_path) or {}
             return (route, params)
             
-        routes = self.api_routes if url_path.startswith("/api") else self.routes
-        
-        for route in routes:
-            params = route.matches(url_path)
-            if params is not None:
-                if not route.is_dynamic:
-                    self._route_cache[url_path] = route
-                return (route, params)
-                
-        return None
+        trie = self._api_trie if url_path.startswith("/api") else self._page_trie
+        match = trie.match(url_path)
+        if match is not None and not match[0].is_dynamic:
+            self._route_cache[url_path] = match[0]
+        return match
         
     def render_route(self, route: Route, context: Dict[str, Any] = None) -> str:
         """Render a route using the appropriate renderer with support for loading/error states"""
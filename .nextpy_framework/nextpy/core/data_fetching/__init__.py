@@ -0,0 +1,45 @@
+"""
+NextPy Data Fetching - Server-side data fetching inspired by Next.js
+Implements:
+- getServerSideProps (SSR) - Fetch data on every request
+- getStaticProps (SSG) - Fetch data at build time
+- getStaticPaths - Generate dynamic routes at build time
+
+Each helper lives in its own submodule and is imported on first access, so
+a static export never loads the SSR code path and a server never loads the
+static path helpers.
+"""
+
+import importlib
+
+_LAZY = {
+    'PropsResult': 'models',
+    'StaticPathsResult': 'models',
+    'PageContext': 'models',
+    'PageNotFoundError': 'models',
+    'RedirectError': 'models',
+    'get_server_side_props': 'ssr',
+    'get_static_props': 'ssg_props',
+    'get_static_paths': 'ssg_paths',
+    'get_static_paths_for_route': 'ssg_paths',
+    'execute_data_fetching': 'execute',
+}
+
+
+def __getattr__(name):
+    """Import the submodule that defines ``name`` and cache the result"""
+    try:
+        submodule = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+__all__ = tuple(_LAZY)
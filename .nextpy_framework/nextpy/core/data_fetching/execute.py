@@ -0,0 +1,54 @@
+"""
+Runs a page module's data fetching function and turns the result into
+template props
+"""
+
+import asyncio
+from typing import Any, Dict
+
+from .models import PageContext, PageNotFoundError, PropsResult, RedirectError
+
+
+async def execute_data_fetching(
+    module: Any,
+    context: PageContext
+) -> Dict[str, Any]:
+    """
+    Execute the appropriate data fetching function for a page module
+    Returns the props to pass to the template
+    """
+    props = {}
+    
+    for name in ["getServerSideProps", "get_server_side_props", "getStaticProps", "get_static_props"]:
+        if hasattr(module, name):
+            func = getattr(module, name)
+            
+            if asyncio.iscoroutinefunction(func):
+                result = await func(context)
+            else:
+                result = func(context)
+                
+            if isinstance(result, PropsResult):
+                if result.not_found:
+                    raise PageNotFoundError()
+                if result.redirect:
+                    raise RedirectError(
+                        result.redirect.get("destination", "/"),
+                        result.redirect.get("permanent", False)
+                    )
+                props.update(result.props)
+            elif isinstance(result, dict):
+                if result.get("not_found"):
+                    raise PageNotFoundError()
+                if result.get("redirect"):
+                    raise RedirectError(
+                        result["redirect"].get("destination", "/"),
+                        result["redirect"].get("permanent", False)
+                    )
+                if "props" in result:
+                    props.update(result["props"])
+                else:
+                    props.update(result)
+            break
+            
+    return props
@@ -0,0 +1,75 @@
+"""
+Result types, page context and control-flow errors shared by the
+data fetching helpers
+"""
+
+from typing import Any, Dict, List, Optional, Union
+from dataclasses import dataclass
+from pydantic import BaseModel
+
+
+class PropsResult(BaseModel):
+    """Result from getServerSideProps or getStaticProps"""
+    props: Dict[str, Any] = {}
+    redirect: Optional[Dict[str, str]] = None
+    not_found: bool = False
+    revalidate: Optional[int] = None
+
+
+class StaticPathsResult(BaseModel):
+    """Result from getStaticPaths"""
+    paths: List[Dict[str, Any]] = []
+    fallback: Union[bool, str] = False
+
+
+@dataclass
+class PageContext:
+    """Context passed to data fetching functions"""
+    params: Dict[str, str]
+    query: Dict[str, str]
+    req: Optional[Any] = None
+    res: Optional[Any] = None
+    preview: bool = False
+    preview_data: Optional[Dict[str, Any]] = None
+    locale: Optional[str] = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Support dict-style access for existing page modules."""
+        if key == "params":
+            return self.params
+        if key == "query":
+            return self.query
+        if key == "req" or key == "request":
+            return self.req
+        if key == "res":
+            return self.res
+        if key == "preview":
+            return self.preview
+        if key == "preview_data":
+            return self.preview_data
+        if key == "locale":
+            return self.locale
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key in {"params", "query", "req", "request", "res", "preview", "preview_data", "locale"}:
+            return self.get(key)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        return key in {"params", "query", "req", "request", "res", "preview", "preview_data", "locale"}
+
+
+class PageNotFoundError(Exception):
+    """Raised when a page returns not_found: True"""
+    pass
+
+
+class RedirectError(Exception):
+    """Raised when a page returns a redirect"""
+    def __init__(self, destination: str, permanent: bool = False):
+        self.destination = destination
+        self.permanent = permanent
+        super().__init__(f"Redirect to {destination}")
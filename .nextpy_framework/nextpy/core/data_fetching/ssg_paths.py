@@ -0,0 +1,71 @@
+"""
+getStaticPaths - Generate dynamic routes at build time
+"""
+
+import asyncio
+import functools
+from typing import Any, Callable, TypeVar
+
+from .models import StaticPathsResult
+
+
+T = TypeVar("T", bound=Callable)
+
+
+def get_static_paths(func: T) -> T:
+    """
+    Decorator to mark a function as getStaticPaths
+    Used with dynamic routes to generate paths at build time
+    
+    Usage:
+        @get_static_paths
+        async def get_paths() -> StaticPathsResult:
+            posts = await fetch_all_posts()
+            return StaticPathsResult(
+                paths=[{"params": {"slug": p.slug}} for p in posts],
+                fallback=False
+            )
+    """
+    func._is_static_paths = True
+    
+    @functools.wraps(func)
+    async def wrapper() -> StaticPathsResult:
+        if asyncio.iscoroutinefunction(func):
+            result = await func()
+        else:
+            result = func()
+            
+        if isinstance(result, dict):
+            result = StaticPathsResult(**result)
+        elif isinstance(result, list):
+            result = StaticPathsResult(paths=result)
+        elif not isinstance(result, StaticPathsResult):
+            result = StaticPathsResult(paths=[])
+            
+        return result
+        
+    wrapper._is_static_paths = True
+    return wrapper
+
+
+async def get_static_paths_for_route(module: Any) -> StaticPathsResult:
+    """
+    Get static paths for a dynamic route module
+    """
+    for name in ["getStaticPaths", "get_static_paths"]:
+        if hasattr(module, name):
+            func = getattr(module, name)
+            
+            if asyncio.iscoroutinefunction(func):
+                result = await func()
+            else:
+                result = func()
+                
+            if isinstance(result, StaticPathsResult):
+                return result
+            elif isinstance(result, dict):
+                return StaticPathsResult(**result)
+            elif isinstance(result, list):
+                return StaticPathsResult(paths=result)
+                
+    return StaticPathsResult(paths=[], fallback=False)
@@ -0,0 +1,48 @@
+"""
+getStaticProps (SSG) - Fetch data at build time
+"""
+
+import asyncio
+import functools
+from typing import Callable, TypeVar
+
+from .models import PageContext, PropsResult
+
+
+T = TypeVar("T", bound=Callable)
+
+
+def get_static_props(func: T) -> T:
+    """
+    Decorator to mark a function as getStaticProps
+    This function will be called at build time (SSG)
+    
+    Usage:
+        @get_static_props
+        async def get_data(context: PageContext) -> PropsResult:
+            data = await fetch_from_cms()
+            return PropsResult(
+                props={"data": data},
+                revalidate=60  # ISR: regenerate every 60 seconds
+            )
+    """
+    func._is_static_props = True
+    func._data_fetching_type = "ssg"
+    
+    @functools.wraps(func)
+    async def wrapper(context: PageContext) -> PropsResult:
+        if asyncio.iscoroutinefunction(func):
+            result = await func(context)
+        else:
+            result = func(context)
+            
+        if isinstance(result, dict):
+            result = PropsResult(**result)
+        elif not isinstance(result, PropsResult):
+            result = PropsResult(props={"data": result})
+            
+        return result
+        
+    wrapper._is_static_props = True
+    wrapper._data_fetching_type = "ssg"
+    return wrapper
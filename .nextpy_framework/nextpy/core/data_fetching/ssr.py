@@ -0,0 +1,45 @@
+"""
+getServerSideProps (SSR) - Fetch data on every request
+"""
+
+import asyncio
+import functools
+from typing import Callable, TypeVar
+
+from .models import PageContext, PropsResult
+
+
+T = TypeVar("T", bound=Callable)
+
+
+def get_server_side_props(func: T) -> T:
+    """
+    Decorator to mark a function as getServerSideProps
+    This function will be called on every request
+    
+    Usage:
+        @get_server_side_props
+        async def get_data(context: PageContext) -> PropsResult:
+            data = await fetch_from_api()
+            return PropsResult(props={"data": data})
+    """
+    func._is_server_side_props = True
+    func._data_fetching_type = "ssr"
+    
+    @functools.wraps(func)
+    async def wrapper(context: PageContext) -> PropsResult:
+        if asyncio.iscoroutinefunction(func):
+            result = await func(context)
+        else:
+            result = func(context)
+            
+        if isinstance(result, dict):
+            result = PropsResult(**result)
+        elif not isinstance(result, PropsResult):
+            result = PropsResult(props={"data": result})
+            
+        return result
+        
+    wrapper._is_server_side_props = True
+    wrapper._data_fetching_type = "ssr"
+    return wrapper
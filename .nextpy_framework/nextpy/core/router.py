@@ -56,6 +56,122 @@ class DynamicRoute(Route):
     is_dynamic: bool = True
 
 
+# File name segments: [...path] and [slug]
+CATCH_ALL_SEGMENT = re.compile(r"\[\.\.\.(\w+)\]")
+DYNAMIC_SEGMENT = re.compile(r"\[(\w+)\]")
+
+# A dynamic segment as it appears in Route.path: (?P<slug>[^/]+) or (?P<path>.+)
+_PARAM_SEGMENT = re.compile(r"\(\?P<(\w+)>(\[\^/\]\+|\.\+)\)")
+
+
+class _TrieNode:
+    """A single path segment in the route trie"""
+    __slots__ = ("static", "param", "catch_all", "leaf")
+
+    def __init__(self):
+        self.static: Dict[str, "_TrieNode"] = {}
+        self.param: Optional["_TrieNode"] = None
+        self.catch_all: Optional[Tuple[Route, List[str]]] = None
+        self.leaf: Optional[Tuple[Route, List[str]]] = None
+
+
+class RouteTrie:
+    """
+    Segment trie used to dispatch URLs to routes in O(path depth).
+    Static segments win over [param] segments, which win over [...catch_all].
+    """
+
+    def __init__(self, routes: List[Route] = ()):
+        self.root = _TrieNode()
+        # Routes the trie cannot represent (catch-all followed by more segments)
+        self.fallback: List[Route] = []
+        for route in routes:
+            self.insert(route)
+
+    @staticmethod
+    def split_path(path: str) -> List[Tuple[str, str]]:
+        """Split a route path into (kind, value) segments"""
+        segments = []
+        pos = 0
+        for m in _PARAM_SEGMENT.finditer(path):
+            segments.extend(("static", s) for s in path[pos:m.start()].split("/") if s)
+            segments.append(("catch_all" if m.group(2) == ".+" else "param", m.group(1)))
+            pos = m.end()
+        segments.extend(("static", s) for s in path[pos:].split("/") if s)
+        return segments
+
+    def insert(self, route: Route) -> None:
+        """Add a route; the first route registered for a given shape wins"""
+        if route.is_dynamic and route.pattern is None:
+            # Without a compiled pattern Route.matches only compares the raw
+            # path, so the linear scan never matched such a route either
+            return
+        segments = self.split_path(route.path)
+        names = [value for kind, value in segments if kind != "static"]
+        node = self.root
+
+        for index, (kind, value) in enumerate(segments):
+            if kind == "catch_all":
+                if index != len(segments) - 1:
+                    self.fallback.append(route)
+                elif node.catch_all is None:
+                    node.catch_all = (route, names)
+                return
+            if kind == "param":
+                if node.param is None:
+                    node.param = _TrieNode()
+                node = node.param
+            else:
+                child = node.static.get(value)
+                if child is None:
+                    child = node.static[value] = _TrieNode()
+                node = child
+
+        if node.leaf is None:
+            node.leaf = (route, names)
+
+    def match(self, url_path: str) -> Optional[Tuple[Route, Dict[str, str]]]:
+        """Find the route for a normalized URL path ("/" or "/a/b")"""
+        segments = url_path[1:].split("/") if url_path != "/" else []
+        values: List[str] = []
+        found = self._match(self.root, segments, 0, values)
+        if found is not None:
+            route, names = found
+            return (route, dict(zip(names, values)))
+
+        for route in self.fallback:
+            params = route.matches(url_path)
+            if params is not None:
+                return (route, params)
+        return None
+
+    def _match(self, node: _TrieNode, segments: List[str], index: int,
+               values: List[str]) -> Optional[Tuple[Route, List[str]]]:
+        if index == len(segments):
+            return node.leaf
+
+        segment = segments[index]
+        child = node.static.get(segment)
+        if child is not None:
+            found = self._match(child, segments, index + 1, values)
+            if found is not None:
+                return found
+
+        if node.param is not None and segment:
+            values.append(segment)
+            found = self._match(node.param, segments, index + 1, values)
+            if found is not None:
+                return found
+            values.pop()
+
+        if node.catch_all is not None:
+            rest = "/".join(segments[index:])
+            if rest:
+                values.append(rest)
+                return node.catch_all
+        return None
+
+
 class Router:
     """
     File-based router that scans the pages directory
@@ -68,6 +184,8 @@ class Router:
         self.routes: List[Route] = []
         self.api_routes: List[Route] = []
         self._route_cache: Dict[str, Route] = {}
+        self._page_trie = RouteTrie()
+        self._api_trie = RouteTrie()
         self._demo_mode = False
         
     def enable_demo_mode(self):
@@ -82,41 +200,51 @@ class Router:
         """Scan the pages directory and register all routes"""
         if not self.pages_dir.exists():
             return
-            
-        for file_path in self.pages_dir.rglob("*.py"):
-            if file_path.name.startswith("_"):
-                continue
-                
-            # Skip layout files - they're handled separately
-            if file_path.name == "layout.py":
-                continue
-                
-            route = self._create_route_from_file(file_path)
-            if route:
-                if route.is_api:
-                    self.api_routes.append(route)
-                else:
-                    self.routes.append(route)
-        
-        # Also scan for .psx files (PSX components)
-        for file_path in self.pages_dir.rglob("*.psx"):
-            if file_path.name.startswith("_"):
-                continue
-                
-            # Skip layout files - they're handled separately
-            if file_path.name == "layout.psx":
-                continue
-                
-            route = self._create_route_from_file(file_path)
+
+        py_files, psx_files, layouts = self._walk_pages()
+
+        # .py pages first, then .psx (PSX components), as before
+        for file_path in py_files + psx_files:
+            route = self._create_route_from_file(file_path, layouts)
             if route:
                 if route.is_api:
                     self.api_routes.append(route)
                 else:
                     self.routes.append(route)
-                    
+
         self._sort_routes()
-        
-    def _create_route_from_file(self, file_path: Path) -> Optional[Route]:
+
+    def _walk_pages(self) -> Tuple[List[Path], List[Path], Dict[Path, Path]]:
+        """One os.scandir pass over pages_dir: page files plus each directory's layout"""
+        py_files: List[Path] = []
+        psx_files: List[Path] = []
+        layouts: Dict[Path, Path] = {}
+
+        pending = [self.pages_dir]
+        while pending:
+            directory = pending.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir():
+                        pending.append(directory / name)
+                    elif name == "layout.psx":
+                        # layout.psx wins over layout.py
+                        layouts[directory] = directory / name
+                    elif name == "layout.py":
+                        layouts.setdefault(directory, directory / name)
+                    elif name.startswith("_"):
+                        continue
+                    elif name.endswith(".py"):
+                        py_files.append(directory / name)
+                    elif name.endswith(".psx"):
+                        psx_files.append(directory / name)
+
+        return py_files, psx_files, layouts
+
+    def _create_route_from_file(
+        self, file_path: Path, layouts: Optional[Dict[Path, Path]] = None
+    ) -> Optional[Route]:
         """Create a Route object from a Python file"""
         relative_path = file_path.relative_to(self.pages_dir)
         parts = list(relative_path.parts)
@@ -138,8 +266,10 @@ class Router:
             if part == "index":
                 continue
                 
-            catch_all_match = re.match(r"\[\.\.\.(\w+)\]", part)
-            dynamic_match = re.match(r"\[(\w+)\]", part)
+            catch_all_match = dynamic_match = None
+            if part.startswith("["):
+                catch_all_match = CATCH_ALL_SEGMENT.match(part)
+                dynamic_match = DYNAMIC_SEGMENT.match(part)
             
             if catch_all_match:
                 param_name = catch_all_match.group(1)
@@ -166,7 +296,7 @@ class Router:
         pattern = None
         if is_dynamic:
             pattern_str = "^" + path.replace("/", r"\/") + "$"
-            pattern_str = re.sub(r"\\\(\?P", "(?P", pattern_str)
+            pattern_str = pattern_str.replace(r"\(?P", "(?P")
             pattern_str = pattern_str.replace(r"\[", "[").replace(r"\]", "]")
             pattern_str = pattern_str.replace(r"\+", "+")
             try:
@@ -177,7 +307,7 @@ class Router:
         handler = self._load_handler(file_path)
         
         # Build layout chain for this route
-        layout_chain = self._build_layout_chain(file_path)
+        layout_chain = self._build_layout_chain(file_path, layouts)
         
         route_class = DynamicRoute if is_dynamic else Route
         return route_class(
@@ -249,22 +379,32 @@ class Router:
                 
         return None
     
-    def _build_layout_chain(self, page_file_path: Path) -> List[Path]:
-        """Build the layout chain for a given page file (inside-out order)"""
+    def _build_layout_chain(
+        self, page_file_path: Path, layouts: Optional[Dict[Path, Path]] = None
+    ) -> List[Path]:
+        """Build the layout chain for a given page file (inside-out order)
+
+        layouts maps directories to their layout file, as collected by
+        _walk_pages; without it each directory is probed on disk.
+        """
         layout_chain = []
         
         # Start from the page's directory and work up to the root
         current_dir = page_file_path.parent
         
         while current_dir != self.pages_dir.parent:
-            # Check for layout.psx first (higher priority), then layout.py
-            layout_psx = current_dir / "layout.psx"
-            layout_py = current_dir / "layout.py"
-            
-            if layout_psx.exists():
-                layout_chain.append(layout_psx)
-            elif layout_py.exists():
-                layout_chain.append(layout_py)
+            if layouts is not None:
+                if current_dir in layouts:
+                    layout_chain.append(layouts[current_dir])
+            else:
+                # Check for layout.psx first (higher priority), then layout.py
+                layout_psx = current_dir / "layout.psx"
+                layout_py = current_dir / "layout.py"
+
+                if layout_psx.exists():
+                    layout_chain.append(layout_psx)
+                elif layout_py.exists():
+                    layout_chain.append(layout_py)
             
             # Move up one directory
             current_dir = current_dir.parent
@@ -330,6 +470,8 @@ class Router:
                 
         self.routes.sort(key=route_priority)
         self.api_routes.sort(key=route_priority)
+        self._page_trie = RouteTrie(self.routes)
+        self._api_trie = RouteTrie(self.api_routes)
         
     def match(self, url_path: str) -> Optional[Tuple[Route, Dict[str, str]]]:
         """Find a route that matches the given URL path"""
@@ -355,16 +497,11 @@ class Router:
             params = route.matches(url_path) or {}
             return (route, params)
             
-        routes = self.api_routes if url_path.startswith("/api") else self.routes
-        
-        for route in routes:
-            params = route.matches(url_path)
-            if params is not None:
-                if not route.is_dynamic:
-                    self._route_cache[url_path] = route
-                return (route, params)
-                
-        return None
+        trie = self._api_trie if url_path.startswith("/api") else self._page_trie
+        match = trie.match(url_path)
+        if match is not None and not match[0].is_dynamic:
+            self._route_cache[url_path] = match[0]
+        return match
         
     def get_all_routes(self) -> List[Route]:
         """Get all registered routes"""
@@ -749,8 +749,7 @@ def inject_debug_ui(html_content: str, page_props: Optional[Dict[str, Any]] = No
     
     # Insert before closing body tag
     if "</body>" in html_content:
-        parts = html_content.split("</body>")
-        html_content = parts[0] + debug_system + "</body>" + parts[1] if len(parts) > 1 else parts[0] + debug_system + "</body>"
+        html_content = html_content.replace("</body>", debug_system + "</body>", 1)
     else:
         html_content += debug_system
     
@@ -63,6 +63,18 @@ def cleanup_effects():
             state.cleanup_functions.clear()
 
 
+def is_same_state(new_value: Any, current_value: Any) -> bool:
+    """True when a state update would not change anything (same type and ==)"""
+    if new_value is current_value:
+        return True
+    if type(new_value) is not type(current_value):
+        return False
+    try:
+        return bool(new_value == current_value)
+    except Exception:
+        return False
+
+
 # Core Hooks
 
 def useState(initial_value: T) -> tuple[T, Callable[[T], None]]:
@@ -73,6 +85,9 @@ def useState(initial_value: T) -> tuple[T, Callable[[T], None]]:
     Example:
         [count, setCount] = useState(0)
         setCount(count + 1)
+
+    Setting a value equal to the current one does not trigger a re-render.
+    Updater functions run immediately and must be pure.
     """
     component = get_current_component()
     
@@ -89,8 +104,11 @@ def useState(initial_value: T) -> tuple[T, Callable[[T], None]]:
     current_value = hook_data['value']
     
     def setter(new_value: T):
+        pending = hook_data['queue'][-1] if hook_data['queue'] else hook_data['value']
         if callable(new_value):
-            new_value = new_value(current_value)
+            new_value = new_value(pending)
+        if is_same_state(new_value, pending):
+            return
         hook_data['queue'].append(new_value)
         component.state['_needs_rerender'] = True
     
@@ -17,6 +17,7 @@ from dataclasses import dataclass, field
 from functools import wraps
 from ..vdom.vnode import VNode, create_element, render, update
 from ..core.parser import PSXElement, psx, render_psx
+from ...hooks import is_same_state
 
 
 @dataclass
@@ -288,6 +289,11 @@ class PSXHooks:
         """
         useState hook with performance optimizations
         Features: Lazy initialization, batch updates, type safety
+
+        Setting a value equal to the current state (same type and ==) is a
+        no-op and does not schedule a re-render. Updater functions passed to
+        the setter run immediately against the latest pending state, so they
+        must be pure: no side effects, same result for the same input.
         """
         component = get_current_component()
         
@@ -303,12 +309,8 @@ class PSXHooks:
         
         # Process queued updates
         if hook_data['queue']:
-            # Apply latest update for performance
-            latest_update = hook_data['queue'][-1]
-            if callable(latest_update):
-                hook_data['value'] = latest_update(hook_data['value'])
-            else:
-                hook_data['value'] = latest_update
+            # Updaters already ran in the setter, so the queue holds values
+            hook_data['value'] = hook_data['queue'][-1]
             hook_data['queue'] = []
             hook_data['version'] += 1
         
@@ -316,10 +318,13 @@ class PSXHooks:
         current_version = hook_data['version']
         
         def setter(new_value: Any):
-            # Type safety check
-            if new_value is not None and not isinstance(new_value, type(current_value)) and current_value is not None:
-                # Allow type changes but warn
-                pass
+            pending = hook_data['queue'][-1] if hook_data['queue'] else hook_data['value']
+            if callable(new_value):
+                new_value = new_value(pending)
+            
+            # Bail out on no-op updates, like React's Object.is check
+            if is_same_state(new_value, pending):
+                return
             
             # Batch updates for performance
             hook_data['queue'].append(new_value)
@@ -1115,6 +1120,13 @@ useFetch = CustomHooks.use_fetch
 useDebounce = CustomHooks.use_debounce
 useInterval = CustomHooks.use_interval
 usePrevious = CustomHooks.use_previous
+useAsync = CustomHooks.use_async
+useMediaQuery = CustomHooks.use_media_query
+useGeolocation = CustomHooks.use_geolocation
+usePerformance = CustomHooks.use_performance
+
+# snake_case alias kept for existing callers
+use_reducer = PSXHooks.use_reducer
 
 
 # PSX Utilities - Complete utility library
@@ -1976,104 +1988,6 @@ class EventHandlers:
         return throttled_handler
 
 
-# Export all hooks and utilities
-def useState(initial_value: Any) -> tuple[Any, Callable]:
-    """useState hook"""
-    return PSXHooks.use_state(initial_value)
-
-def useEffect(effect: Callable, deps: Optional[List[Any]] = None):
-    """useEffect hook"""
-    return PSXHooks.use_effect(effect, deps)
-
-def useContext(context: 'Context') -> Any:
-    """useContext hook"""
-    return PSXHooks.use_context(context)
-
-def use_reducer(reducer: Callable, initial_state: Any, init_action: Any = None) -> tuple[Any, Callable]:
-    """useReducer hook"""
-    return PSXHooks.use_reducer(reducer, initial_state, init_action)
-
-def useRef(initial_value: Any = None) -> Dict[str, Any]:
-    """useRef hook"""
-    return PSXHooks.use_ref(initial_value)
-
-def useMemo(factory: Callable, deps: Optional[List[Any]] = None) -> Any:
-    """useMemo hook"""
-    return PSXHooks.use_memo(factory, deps)
-
-def useCallback(callback: Callable, deps: Optional[List[Any]] = None) -> Callable:
-    """useCallback hook"""
-    return PSXHooks.use_callback(callback, deps)
-
-def useImperativeHandle(ref: Dict[str, Any], create_handle: Callable, deps: Optional[List[Any]] = None):
-    """useImperativeHandle hook"""
-    return PSXHooks.use_imperative_handle(ref, create_handle, deps)
-
-def useLayoutEffect(effect: Callable, deps: Optional[List[Any]] = None):
-    """useLayoutEffect hook"""
-    return PSXHooks.use_layout_effect(effect, deps)
-
-def useDebugValue(value: Any, formatter: Optional[Callable] = None):
-    """useDebugValue hook"""
-    return PSXHooks.use_debug_value(value, formatter)
-
-def useTransition() -> tuple[bool, Callable]:
-    """useTransition hook"""
-    return PSXHooks.use_transition()
-
-def useDeferredValue(value: Any) -> Any:
-    """useDeferredValue hook"""
-    return PSXHooks.use_deferred_value(value)
-
-def useId() -> str:
-    """useId hook"""
-    return PSXHooks.use_id()
-
-# Custom hooks exports
-def useCounter(initial_value: int = 0, step: int = 1) -> tuple[int, Callable, Callable]:
-    """useCounter custom hook"""
-    return CustomHooks.use_counter(initial_value, step)
-
-def useToggle(initial_value: bool = False) -> tuple[bool, Callable]:
-    """useToggle custom hook"""
-    return CustomHooks.use_toggle(initial_value)
-
-def useLocalStorage(key: str, initial_value: Any) -> tuple[Any, Callable]:
-    """useLocalStorage custom hook"""
-    return CustomHooks.use_local_storage(key, initial_value)
-
-def useFetch(url: str, options: Dict[str, Any] = None) -> Dict[str, Any]:
-    """useFetch custom hook"""
-    return CustomHooks.use_fetch(url, options)
-
-def useDebounce(value: Any, delay: int) -> Any:
-    """useDebounce custom hook"""
-    return CustomHooks.use_debounce(value, delay)
-
-def useInterval(callback: Callable, delay: int, immediate: bool = False):
-    """useInterval custom hook"""
-    return CustomHooks.use_interval(callback, delay, immediate)
-
-def usePrevious(value: Any) -> Any:
-    """usePrevious custom hook"""
-    return CustomHooks.use_previous(value)
-
-def useAsync(async_func: Callable, deps: Optional[List[Any]] = None) -> Dict[str, Any]:
-    """useAsync custom hook"""
-    return CustomHooks.use_async(async_func, deps)
-
-def useMediaQuery(query: str) -> bool:
-    """useMediaQuery custom hook"""
-    return CustomHooks.use_media_query(query)
-
-def useGeolocation(options: Dict[str, Any] = None) -> Dict[str, Any]:
-    """useGeolocation custom hook"""
-    return CustomHooks.use_geolocation(options)
-
-def usePerformance() -> Dict[str, Any]:
-    """usePerformance custom hook"""
-    return CustomHooks.use_performance()
-
 # Event handler exports
 def create_onclick(handler_func: Callable) -> str:
     """Create onclick handler"""
@@ -5,6 +5,7 @@ Integrates AST nodes, safe evaluation, and logic execution
 
 import ast
 import html
+import re
 from typing import Any, Dict, List, Optional, Union
 from .ast_nodes import (
     PSXNode, PSXNodeUnion, ExpressionNode, LogicNode, IfNode, ForNode, WhileNode, TryNode, PSXASTParser,
@@ -12,6 +13,10 @@ from .ast_nodes import (
 )
 from .evaluator import SafeExpressionEngine
 
+# A '}' directly before a space or line break, left over after control flow
+# blocks are expanded
+_STRAY_CLOSING_BRACE = re.compile(r"\}(?=[ \n\r])")
+
 
 class PSXRuntimeError(Exception):
     """Runtime error with context information"""
@@ -880,7 +885,9 @@ def process_python_logic(psx_str: str, context: Dict[str, Any]) -> str:
         result_text = ''.join(result)
         # Remove any remaining standalone } characters that aren't part of expressions
         # Only remove } that are not preceded by { (to avoid breaking expressions)
-        result_text = result_text.replace('} ', ' ').replace('}\n', '\n').replace('}\r', '\r')
+        # str.__contains__ is a memchr scan; most output has no '}' left at all
+        if '}' in result_text:
+            result_text = _STRAY_CLOSING_BRACE.sub('', result_text)
         
         return result_text
     
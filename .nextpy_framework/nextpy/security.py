@@ -8,6 +8,27 @@ import re
 from typing import Any, Dict, List, Union
 from markupsafe import Markup, escape
 
+# Compiled once at import; sanitize_html runs for every string prop
+_DANGEROUS_HTML_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'on\w+\s*=',  # Event handlers
+        r'javascript\s*:',  # JavaScript URLs
+        r'data\s*:',  # Data URLs
+        r'vbscript\s*:',  # VBScript URLs
+    )
+)
+
+_DANGEROUS_CSS_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'javascript\s*:',
+        r'expression\s*\(',
+        r'@import\s+',
+        r'binding\s*:',
+    )
+)
+
 
 class SecurityManager:
     """Manages security features for NextPy applications"""
@@ -30,15 +51,8 @@ class SecurityManager:
         sanitized = html.escape(content)
         
         # Remove potentially dangerous attributes
-        dangerous_patterns = [
-            r'on\w+\s*=',  # Event handlers
-            r'javascript\s*:',  # JavaScript URLs
-            r'data\s*:',  # Data URLs
-            r'vbscript\s*:',  # VBScript URLs
-        ]
-        
-        for pattern in dangerous_patterns:
-            sanitized = re.sub(pattern, '', sanitized, flags=re.IGNORECASE)
+        for pattern in _DANGEROUS_HTML_PATTERNS:
+            sanitized = pattern.sub('', sanitized)
         
         return sanitized
     
@@ -129,16 +143,9 @@ class SecurityManager:
             return ""
         
         # Remove dangerous CSS constructs
-        dangerous_patterns = [
-            r'javascript\s*:',
-            r'expression\s*\(',
-            r'@import\s+',
-            r'binding\s*:',
-        ]
-        
         sanitized = css
-        for pattern in dangerous_patterns:
-            sanitized = re.sub(pattern, '', sanitized, flags=re.IGNORECASE)
+        for pattern in _DANGEROUS_CSS_PATTERNS:
+            sanitized = pattern.sub('', sanitized)
         
         return sanitized
     
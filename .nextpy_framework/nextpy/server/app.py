@@ -18,6 +18,12 @@ from starlette.websockets import WebSocketState
 
 # Import PSX for complete integration
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Set by `nextpy dev`; the process serving requests indexes the project modules
+if os.environ.get("NEXTPY_PROJECT_FINDER"):
+    from nextpy.server.project_finder import install_project_finder
+    install_project_finder(os.environ["NEXTPY_PROJECT_FINDER"])
+
 from nextpy.psx import (
     compile_psx, render_psx, psx, PSXElement, component,
     useState, useEffect, process_python_logic,
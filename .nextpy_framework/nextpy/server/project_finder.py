@@ -0,0 +1,83 @@
+"""
+NextPy Project Finder - answers imports of project modules from an index
+
+A plain `import components.button` makes Python's path finder stat every
+sys.path entry, for every module, again after each dev reload. The dev server
+indexes the project's own modules once (one os.scandir pass) and resolves them
+from a dict. Anything not in the index falls through to the normal importers.
+"""
+
+import importlib.machinery
+import importlib.util
+import os
+import sys
+from typing import Dict, Tuple
+
+# Project directories whose modules are imported by dotted name
+PROJECT_PACKAGES = ("pages", "components", "templates")
+
+
+class ProjectModuleFinder:
+    """sys.meta_path finder backed by a {module name: (file, is_package)} index"""
+
+    def __init__(self, project_dir: str):
+        self.project_dir = os.path.abspath(project_dir)
+        self.index: Dict[str, Tuple[str, bool]] = {}
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Re-scan the project tree"""
+        index: Dict[str, Tuple[str, bool]] = {}
+        with os.scandir(self.project_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(".py"):
+                    stem = entry.name[:-3]
+                    if stem.isidentifier():
+                        index[stem] = (entry.path, False)
+                elif entry.is_dir() and entry.name in PROJECT_PACKAGES:
+                    self._scan(entry.path, entry.name, index)
+        self.index = index
+
+    def _scan(self, directory: str, prefix: str, index: Dict[str, Tuple[str, bool]]) -> None:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir():
+                    if name.isidentifier() and name != "__pycache__":
+                        self._scan(entry.path, f"{prefix}.{name}", index)
+                elif name == "__init__.py":
+                    index[prefix] = (entry.path, True)
+                elif name.endswith(".py") and name[:-3].isidentifier():
+                    index[f"{prefix}.{name[:-3]}"] = (entry.path, False)
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        found = self.index.get(fullname)
+        if found is None:
+            return None
+
+        file_path, is_package = found
+        return importlib.util.spec_from_file_location(
+            fullname,
+            file_path,
+            submodule_search_locations=[os.path.dirname(file_path)] if is_package else None,
+        )
+
+    def invalidate_caches(self) -> None:
+        """Called by importlib.invalidate_caches()"""
+        self.rebuild()
+
+
+def install_project_finder(project_dir: str) -> ProjectModuleFinder:
+    """Register a finder for project_dir, replacing any previous one"""
+    sys.meta_path[:] = [f for f in sys.meta_path if not isinstance(f, ProjectModuleFinder)]
+
+    finder = ProjectModuleFinder(project_dir)
+
+    # Sit just before the path finder: builtins and frozen modules still win,
+    # as they would with the project directory on sys.path
+    try:
+        position = sys.meta_path.index(importlib.machinery.PathFinder)
+    except ValueError:
+        position = len(sys.meta_path)
+    sys.meta_path.insert(position, finder)
+    return finder
@@ -0,0 +1,46 @@
+"""
+Builder tests - pages build concurrently, the manifest keeps route order
+"""
+
+import asyncio
+
+import pytest
+from click.testing import CliRunner
+
+from nextpy.cli import cli
+from nextpy.core.builder import Builder
+from nextpy.core.router import Route
+
+
+def test_build_pages_bounded_and_ordered(tmp_path):
+    builder = Builder(pages_dir=str(tmp_path), out_dir=str(tmp_path / "out"), concurrency=2)
+    running = []
+    peak = []
+
+    async def fake_build_page(route, params=None):
+        running.append(route.path)
+        peak.append(len(running))
+        # Later routes finish first
+        await asyncio.sleep(0.01 * (5 - int(route.path[2:])))
+        builder.build_manifest["pages"][route.path] = {}
+        running.remove(route.path)
+
+    builder._build_page = fake_build_page
+    jobs = [(Route(path=f"/p{i}", file_path=tmp_path / f"p{i}.py"), None) for i in range(5)]
+    asyncio.run(builder._build_pages(jobs))
+
+    assert max(peak) == 2
+    assert list(builder.build_manifest["pages"]) == [f"/p{i}" for i in range(5)]
+
+
+def test_concurrency_defaults_to_cpus_and_rejects_zero(tmp_path):
+    assert Builder(pages_dir=str(tmp_path)).concurrency >= 1
+    with pytest.raises(ValueError):
+        Builder(pages_dir=str(tmp_path), concurrency=0)
+
+
+@pytest.mark.parametrize("command", ["build", "export"])
+def test_cli_rejects_zero_concurrency(command):
+    result = CliRunner().invoke(cli, [command, "--concurrency", "0"])
+    assert result.exit_code == 2
+    assert "0 is not in the range x>=1" in result.output
@@ -0,0 +1,17 @@
+"""
+Form component tests - widgets that take a `label` argument still render one
+"""
+
+from nextpy.components.form import Checkbox, FormGroup, Input, RadioGroup
+
+
+def test_checkbox_and_radio_render_labels():
+    assert "<label" in str(Checkbox(name="terms", label="I agree"))
+    group = str(RadioGroup(name="plan", options=[{"value": "pro", "label": "Pro"}], value="pro"))
+    assert ">Pro</label>" in group and "checked" in group
+
+
+def test_form_group_marks_required_label():
+    html = str(FormGroup(label="Email", required=True, children=[Input(name="email")]))
+    assert ">Email *</label>" in html
+    assert 'name="email"' in html
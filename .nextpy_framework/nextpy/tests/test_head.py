@@ -0,0 +1,42 @@
+"""
+Head component tests - repeated tags are de-duplicated
+"""
+
+from nextpy.components.head import Head
+
+
+def test_meta_replaced_by_name():
+    head = Head()
+    head.add_meta(name="author", content="A")
+    head.add_meta(property="og:locale", content="en_US")
+    head.add_meta(name="author", content="B")
+    assert head.extra_meta == [
+        {"name": "author", "content": "B"},
+        {"property": "og:locale", "content": "en_US"},
+    ]
+    html = head.render()
+    assert 'content="B"' in html and 'content="A"' not in html
+
+
+def test_links_keyed_by_rel_and_href():
+    head = Head()
+    head.add_link(rel="preload", href="/a.css", **{"as": "style"})
+    head.add_link(rel="stylesheet", href="/a.css")
+    head.add_link(rel="preload", href="/a.css", **{"as": "style"})
+    assert len(head.extra_links) == 2
+
+
+def test_scripts_keyed_by_src_or_key():
+    head = Head()
+    head.add_script("/app.js")
+    head.add_script("/app.js", defer="defer")
+    head.add_script(key="analytics", content="a()")
+    head.add_script(key="analytics", content="b()")
+    head.add_script(content="inline()")
+    head.add_script(content="inline()")
+    assert head.extra_scripts == [
+        {"src": "/app.js", "defer": "defer"},
+        {"content": "b()"},
+        {"content": "inline()"},
+        {"content": "inline()"},
+    ]
@@ -0,0 +1,107 @@
+import ast
+import subprocess
+import sys
+import tomllib
+from importlib import metadata
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+import nextpy
+from nextpy.cli import cli
+
+
+STUB_PATH = Path(nextpy.__file__).with_suffix(".pyi")
+
+
+def _stub_imports():
+    tree = ast.parse(STUB_PATH.read_text(encoding="utf-8"))
+    imports = {}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                imports[alias.asname or alias.name] = (node.module, alias.name)
+    return imports
+
+
+def test_stub_matches_lazy_map():
+    assert _stub_imports() == nextpy._LAZY
+
+
+def test_concurrent_first_access():
+    code = (
+        "import threading, nextpy\n"
+        "found = []\n"
+        "threads = [threading.Thread(target=lambda: found.append(nextpy.Router)) for _ in range(16)]\n"
+        "[t.start() for t in threads]\n"
+        "[t.join() for t in threads]\n"
+        "print(len(found), len(set(map(id, found))))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.stdout.strip() == "16 1", result.stderr
+
+
+def test_all_names_resolve():
+    for name in nextpy.__all__:
+        assert hasattr(nextpy, name), name
+
+
+def test_star_import():
+    namespace = {}
+    exec("from nextpy import *", namespace)
+    assert set(nextpy.__all__) <= set(namespace)
+
+
+def test_hooks_are_identity_stable():
+    from nextpy.psx.components.component import PSXHooks
+    assert nextpy.useCallback is PSXHooks.use_callback
+    assert nextpy.useMemo is PSXHooks.use_memo
+    assert nextpy.useMemo is nextpy.useMemo
+
+
+def test_hooks_survive_reload():
+    # Reloading resets the lazy cache and module globals, so keep it out of
+    # the shared test process
+    code = (
+        "import importlib, nextpy\n"
+        "memo = nextpy.useMemo\n"
+        "print(importlib.reload(nextpy).useMemo is memo)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.stdout.strip() == "True", result.stderr
+
+
+def test_uninstalled_version_falls_back_to_pyproject(monkeypatch):
+    def missing(name):
+        raise metadata.PackageNotFoundError(name)
+
+    monkeypatch.setattr(metadata, "version", missing)
+    # Registered so teardown drops the value _read_version caches
+    monkeypatch.setitem(vars(nextpy), "__version__", None)
+    assert nextpy._read_version() == nextpy._SOURCE_VERSION
+
+    pyproject = Path(nextpy.__file__).parents[2] / "pyproject.toml"
+    if not pyproject.exists():
+        pytest.skip("not running from a source checkout")
+    project = tomllib.loads(pyproject.read_text(encoding="utf-8"))["project"]
+    assert nextpy._SOURCE_VERSION == project["version"]
+
+
+@pytest.mark.parametrize("args", [["--version"], ["version"], ["info"]])
+def test_cli_reports_package_version(args):
+    result = CliRunner().invoke(cli, args)
+    assert result.exit_code == 0
+    assert nextpy.__version__ in result.output
+
+
+def test_dir_lists_public_names_only():
+    names = dir(nextpy)
+    assert set(nextpy.__all__) <= set(names)
+    assert "__version__" in names
+    assert "importlib" not in names and "_resolve" not in names
+
+
+def test_package_metadata_globals():
+    assert nextpy.main == "nextpy.server.app:create_app"
+    assert nextpy.maintainers[0]["name"] == "NextPy Team"
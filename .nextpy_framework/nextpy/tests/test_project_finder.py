@@ -0,0 +1,57 @@
+"""
+Project finder tests - project modules resolve from the index
+"""
+
+import importlib
+import sys
+
+import pytest
+
+from nextpy.server.project_finder import ProjectModuleFinder, install_project_finder
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "main.py").write_text("VALUE = 'main'\n")
+    (tmp_path / "components").mkdir()
+    (tmp_path / "components" / "__init__.py").write_text("")
+    (tmp_path / "components" / "button.py").write_text("VALUE = 'button'\n")
+    (tmp_path / "pages" / "blog").mkdir(parents=True)
+    (tmp_path / "pages" / "blog" / "widgets.py").write_text("VALUE = 'widgets'\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "skip.py").write_text("")
+
+    saved_meta_path = list(sys.meta_path)
+    yield tmp_path
+    sys.meta_path[:] = saved_meta_path
+    for name in list(sys.modules):
+        if name == "main" or name.split(".")[0] in ("components", "pages"):
+            del sys.modules[name]
+
+
+def test_index_covers_project_packages(project):
+    finder = ProjectModuleFinder(str(project))
+    assert finder.index["main"] == (str(project / "main.py"), False)
+    assert finder.index["components"][1] is True
+    assert "components.button" in finder.index
+    assert "pages.blog.widgets" in finder.index
+    assert not any(name.startswith("node_modules") for name in finder.index)
+
+
+def test_finder_resolves_imports(project):
+    finder = install_project_finder(str(project))
+    assert sys.meta_path.count(finder) == 1
+    assert sys.meta_path.index(finder) < sys.meta_path.index(importlib.machinery.PathFinder)
+
+    button = importlib.import_module("components.button")
+    assert button.VALUE == "button"
+    assert button.__spec__.origin == str(project / "components" / "button.py")
+    assert finder.find_spec("json") is None
+
+
+def test_invalidate_caches_rescans(project):
+    finder = install_project_finder(str(project))
+    (project / "components" / "card.py").write_text("")
+    assert "components.card" not in finder.index
+    importlib.invalidate_caches()
+    assert "components.card" in finder.index
@@ -0,0 +1,81 @@
+"""
+Route trie tests - the trie must agree with the per-route regex patterns
+"""
+
+from nextpy.core.router import DynamicRoute, Router, RouteTrie
+
+
+PAGES = [
+    "index.py",
+    "about.py",
+    "blog/index.py",
+    "blog/new.py",
+    "blog/[slug].py",
+    "blog/[slug]/comments.py",
+    "docs/[...path].py",
+    "users/[id]/posts/[post_id].py",
+    "api/health.py",
+    "api/posts/[id].py",
+]
+
+
+def _router(tmp_path):
+    for name in PAGES:
+        page = tmp_path / name
+        page.parent.mkdir(parents=True, exist_ok=True)
+        page.write_text("def Page(props=None):\n    return None\n")
+    router = Router(pages_dir=str(tmp_path))
+    router.scan_pages()
+    return router
+
+
+def _linear_match(router, url_path):
+    routes = router.api_routes if url_path.startswith("/api") else router.routes
+    for route in routes:
+        params = route.matches(url_path)
+        if params is not None:
+            return (route, params)
+    return None
+
+
+def test_static_beats_dynamic(tmp_path):
+    router = _router(tmp_path)
+    route, params = router.match("/blog/new")
+    assert route.path == "/blog/new"
+    assert params == {}
+
+
+def test_params_and_catch_all(tmp_path):
+    router = _router(tmp_path)
+    assert router.match("/blog/hello")[1] == {"slug": "hello"}
+    assert router.match("/blog/hello/comments")[1] == {"slug": "hello"}
+    assert router.match("/docs/a/b/c")[1] == {"path": "a/b/c"}
+    assert router.match("/users/7/posts/9")[1] == {"id": "7", "post_id": "9"}
+    assert router.match("/api/posts/3")[1] == {"id": "3"}
+    assert router.match("/docs") is None
+    assert router.match("/blog/hello/missing") is None
+
+
+def test_trie_agrees_with_linear_scan(tmp_path):
+    router = _router(tmp_path)
+    urls = [
+        "/", "/about", "/about/", "/blog", "/blog/new", "/blog/x", "/blog/x/comments",
+        "/docs/a", "/docs/a/b", "/users/1/posts/2", "/users/1/posts",
+        "/api/health", "/api/posts/1", "/api/missing", "/nope",
+    ]
+    for url in urls:
+        url = url.rstrip("/") or "/"
+        expected = _linear_match(router, url)
+        actual = router.match(url)
+        if expected is None:
+            assert actual is None, url
+        else:
+            assert actual[0] is expected[0], url
+            assert actual[1] == expected[1], url
+
+
+def test_dynamic_route_without_pattern_is_skipped(tmp_path):
+    broken = DynamicRoute(path="/blog/(?P<slug>[^/]+)", file_path=tmp_path / "x.py")
+    trie = RouteTrie([broken])
+    assert trie.match("/blog/hello") is None
+    assert broken.matches("/blog/hello") is None
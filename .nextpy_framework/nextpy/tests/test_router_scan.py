@@ -0,0 +1,39 @@
+"""
+Router scan tests - one directory walk finds pages and their layouts
+"""
+
+from nextpy.core.router import Router
+
+
+def test_scan_collects_pages_and_layout_chains(tmp_path):
+    for name in (
+        "index.py",
+        "about.psx",
+        "_app.py",
+        "layout.py",
+        "blog/layout.py",
+        "blog/layout.psx",
+        "blog/[slug].py",
+        "blog/archive/2024.py",
+        "api/health.py",
+    ):
+        page = tmp_path / name
+        page.parent.mkdir(parents=True, exist_ok=True)
+        page.write_text("def Page(props=None):\n    return None\n")
+
+    router = Router(pages_dir=str(tmp_path))
+    router.scan_pages()
+
+    routes = {route.path: route for route in router.routes}
+    assert set(routes) == {"/", "/about", "/blog/archive/2024", "/blog/(?P<slug>[^/]+)"}
+    assert [route.path for route in router.api_routes] == ["/api/health"]
+
+    # Root layout first; layout.psx wins over layout.py in the same directory
+    assert routes["/blog/archive/2024"].layout_chain == [
+        tmp_path / "layout.py",
+        tmp_path / "blog" / "layout.psx",
+    ]
+    assert routes["/about"].layout_chain == [tmp_path / "layout.py"]
+    assert router._build_layout_chain(tmp_path / "blog" / "[slug].py") == (
+        routes["/blog/(?P<slug>[^/]+)"].layout_chain
+    )
@@ -0,0 +1,53 @@
+"""
+Scaffold template tests - every file nextpy create copies ships as package data
+"""
+
+from importlib.resources import files
+
+import pytest
+from click.testing import CliRunner
+
+from nextpy import cli
+
+GROUPS = (
+    ("project", cli._TEMPLATE_FILES),
+    (
+        "psx",
+        cli._PSX_HOMEPAGE_FILES
+        + ("pages/about.py", "pages/examples.py")
+        + cli._PSX_EDITOR_FILES,
+    ),
+    ("traditional", ("pages/index.py",)),
+)
+
+
+@pytest.mark.parametrize("group,rels", GROUPS, ids=[group for group, _ in GROUPS])
+def test_template_files_exist(group, rels):
+    source_dir = files("nextpy._templates").joinpath(group)
+    missing = [rel for rel in rels if not source_dir.joinpath(f"{rel}.tmpl").is_file()]
+    assert missing == []
+
+
+def test_failed_create_cleans_up_and_exits_non_zero(tmp_path, monkeypatch):
+    def broken(project_dir, psx=True, template="default"):
+        (project_dir / "pages").mkdir(parents=True)
+        raise FileNotFoundError("settings.json.tmpl")
+
+    monkeypatch.setattr(cli, "_create_project_structure", broken)
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(cli.cli, ["create", "proj"])
+    assert result.exit_code == 1
+    assert "Failed to create project" in result.output
+    assert not (tmp_path / "proj").exists()
+
+
+def test_small_batches_copy_without_a_thread_pool(tmp_path, monkeypatch):
+    import concurrent.futures
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("thread pool started for a small batch")
+
+    monkeypatch.setattr(concurrent.futures, "ThreadPoolExecutor", no_pool)
+    cli._copy_project_files(tmp_path, cli._PSX_EDITOR_FILES, "psx")
+    assert all((tmp_path / rel).is_file() for rel in cli._PSX_EDITOR_FILES)
@@ -0,0 +1,65 @@
+"""
+useState bailout tests - no-op updates must not schedule a re-render
+"""
+
+import pytest
+
+from nextpy import hooks
+from nextpy.psx.components import component
+
+
+@pytest.fixture
+def psx_state():
+    component._component_state.current = {}
+    yield component.get_current_component()
+    component._component_state.current = {}
+
+
+@pytest.fixture
+def legacy_state():
+    hooks._hook_state.current = {}
+    yield hooks.get_current_component()
+    hooks._hook_state.current = {}
+
+
+def test_same_value_skips_rerender(psx_state):
+    count, set_count = component.useState(0)
+    set_count(0)
+    set_count(lambda value: value)
+    assert "_needs_rerender" not in psx_state.state
+    assert psx_state.hooks[0]["queue"] == []
+
+
+def test_type_change_is_not_a_bailout(psx_state):
+    flag, set_flag = component.useState(1)
+    set_flag(True)
+    assert psx_state.state["_needs_rerender"] is True
+
+
+def test_functional_updates_chain(psx_state):
+    count, set_count = component.useState(0)
+    set_count(1)
+    set_count(lambda value: value + 1)
+    component.reset_component_state()
+    count, set_count = component.useState(0)
+    assert count == 2
+
+
+def test_legacy_use_state_bailout(legacy_state):
+    count, set_count = hooks.useState(5)
+    set_count(5)
+    assert "_needs_rerender" not in legacy_state.state
+    set_count(lambda value: value + 1)
+    assert legacy_state.state["_needs_rerender"] is True
+
+
+def test_function_state_is_stored_not_called(psx_state):
+    def handler():
+        raise AssertionError("stored state must not be called")
+
+    value, set_value = component.useState(None)
+    set_value(lambda previous: handler)
+    component.reset_component_state()
+    value, set_value = component.useState(None)
+    assert value is handler
+
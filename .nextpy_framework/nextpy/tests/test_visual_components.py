@@ -0,0 +1,21 @@
+"""
+Visual component tests - pagination markup and caching
+"""
+
+from nextpy.components.visual import Pagination, _pagination
+
+
+def test_pagination_marks_current_page():
+    html = Pagination(2, 3, "/posts")
+    assert html.startswith('<div class="flex gap-2"><a href="/posts?page=1" ')
+    assert '<span class="px-3 py-1 bg-blue-600 text-white rounded">2</span>' in html
+    assert html.count("<a ") == 2
+    assert Pagination(1, 0) == '<div class="flex gap-2"></div>'
+
+
+def test_pagination_is_cached_per_arguments():
+    _pagination.cache_clear()
+    first = Pagination(1, 50, "/search?q=100%")
+    assert Pagination(1, 50, "/search?q=100%") is first
+    assert _pagination.cache_info().hits == 1
+    assert 'href="/search?q=100%?page=2"' in first